@@ -29,23 +29,23 @@ def main() -> int:
     runtime_root = Path(args.runtime)
     repo_root = Path(".")
 
-    audit = get_audit_writer(runtime_root)
-    policy = PolicyEngine()
-    tools = ToolRegistry(policy=policy, audit=audit, repo_root=repo_root, runtime_root=runtime_root)
+    with get_audit_writer(runtime_root) as audit:
+        policy = PolicyEngine()
+        tools = ToolRegistry(policy=policy, audit=audit, repo_root=repo_root, runtime_root=runtime_root)
 
-    tools.register(fs_list_dir_spec)
-    tools.register(fs_read_file_spec)
-    tools.register(git_diff_spec)
-    tools.register(git_apply_patch_spec)
+        tools.register(fs_list_dir_spec)
+        tools.register(fs_read_file_spec)
+        tools.register(git_diff_spec)
+        tools.register(git_apply_patch_spec)
 
-    router = ModelRouter.load(Path(args.router))
-    orch = Orchestrator(tools=tools, audit=audit, router=router, runtime_root=runtime_root)
+        router = ModelRouter.load(Path(args.router))
+        orch = Orchestrator(tools=tools, audit=audit, router=router, runtime_root=runtime_root)
 
 
-    run_id = uuid.uuid4().hex
-    obs = ObservationEvent(run_id=run_id, kind="file_read", data={"path": args.read_file}) if args.read_file else ObservationEvent(run_id=run_id, kind="text", data={"text": ""})
+        run_id = uuid.uuid4().hex
+        obs = ObservationEvent(run_id=run_id, kind="file_read", data={"path": args.read_file}) if args.read_file else ObservationEvent(run_id=run_id, kind="text", data={"text": ""})
 
-    res = orch.run_once(obs)
+        res = orch.run_once(obs)
     print(res)
     return 0 if res.ok else 1
 
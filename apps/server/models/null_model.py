@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import uuid
 
+from operator import attrgetter
 from typing import List
 
 from packages.core.types import (
@@ -23,6 +24,8 @@ from packages.core.types import (
     CriticReport,
 )
 
+_OK = attrgetter("ok")
+
 
 class NullModel:
     """
@@ -57,7 +60,7 @@ class NullModel:
     def critique(self, observation: ObservationEvent, tool_results: List[ToolResult]) -> CriticReport:
         run_id = observation.run_id
 
-        if any(not r.ok for r in tool_results):
+        if not all(map(_OK, tool_results)):
             # Deterministic: request retry when any tool fails.
             # Orchestrator will cap attempts and convert final retry->failed.
             return CriticReport(run_id=run_id, decision=CriticDecision.retry, reason="tool failure")
@@ -54,11 +54,19 @@ class Orchestrator:
 
         results: List[ToolResult] = []
 
+        # Roles don't change mid-run: resolve backends once, not per attempt.
+        # Resolved per run (not in __init__) so router changes apply to the next run.
+        try:
+            planner = self._router.get_backend_for_role("planner")
+            executor = self._router.get_backend_for_role("executor")
+            critic = self._router.get_backend_for_role("critic")
+        except Exception as e:
+            err = f"{e.__class__.__name__}: {e}"
+            self._audit.append(run_id, "RunFailed", {"error": err, "attempts": 1})
+            return RunResult(run_id=run_id, ok=False, tool_results=results, error=err)
+
         for attempt in range(1, self._max_attempts + 1):
             try:
-                planner = self._router.get_backend_for_role("planner")
-                executor = self._router.get_backend_for_role("executor")
-                critic = self._router.get_backend_for_role("critic")
                 # PLANNER
                 plan: ToolPlan = planner.plan(observation)
                 self._audit_plan(run_id, plan, attempt)
@@ -7,10 +7,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-import json
 
-from .writer import verify_audit_log
-from packages.core.codec import stable_sha256
+import hashlib
+
+from .writer import _VerifyError, _iter_verified
+from packages.core.codec import canonical_json_bytes
 
 
 @dataclass(frozen=True)
@@ -22,54 +23,86 @@ class ReplayResult:
     replay_state_hash: Optional[str] = None
 
 
-def replay_audit_log(path: Path) -> ReplayResult:
-    ok, err = verify_audit_log(path)
-    if not ok:
-        return ReplayResult(ok=False, error=f"audit verification failed: {err}")
+def _next_state_hash(prev: str, event_hash: str, etype: str) -> str:
+    """
+    stable_sha256({"prev": prev, "event_hash": event_hash, "type": etype}), with the
+    canonical bytes laid out directly (keys already in sorted order).
+    """
+    body = b"".join((
+        b'{"event_hash":', canonical_json_bytes(event_hash),
+        b',"prev":', canonical_json_bytes(prev),
+        b',"type":', canonical_json_bytes(etype),
+        b"}",
+    ))
+    return hashlib.sha256(body).hexdigest()
 
-    lines = [ln for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
-    if not lines:
-        return ReplayResult(ok=False, error="empty audit log")
+
+def replay_audit_log(path: Path) -> ReplayResult:
+    if not path.exists():
+        return ReplayResult(ok=False, error="audit verification failed: audit log does not exist")
 
     # Deterministic derived state: hash over (prev_state_hash + event_hash + type)
     state_hash = "GENESIS"
-
-    first = json.loads(lines[0])
-    run_id = first.get("run_id")
-    if not run_id:
-        return ReplayResult(ok=False, error="missing run_id on first event")
+    run_id: Optional[str] = None
+    events = 0
 
     # Ordering invariants (minimal but strict enough to catch corruption)
     seen_start = False
     seen_end = False
-
-    for i, ln in enumerate(lines, start=1):
-        ev = json.loads(ln)
-        if ev.get("run_id") != run_id:
-            return ReplayResult(ok=False, error=f"mixed run_id at line {i}")
-
-        etype = ev.get("type")
-        ehash = ev.get("hash")
-        if not etype or not ehash:
-            return ReplayResult(ok=False, error=f"missing type/hash at line {i}")
-
-        if i == 1:
-            if etype != "RunStarted":
-                return ReplayResult(ok=False, error="first event must be RunStarted")
-            seen_start = True
-        else:
-            if not seen_start:
-                return ReplayResult(ok=False, error="RunStarted missing")
-            if seen_end:
-                return ReplayResult(ok=False, error="events after terminal event")
-
-        if etype in {"RunCompleted", "RunFailed"}:
-            seen_end = True
-
-        # Deterministic replay-state update
-        state_hash = stable_sha256({"prev": state_hash, "event_hash": ehash, "type": etype})
-
+    order_error: Optional[str] = None
+
+    # Single pass: chain verification and replay share one read of the file. After an
+    # ordering error we keep consuming lines so chain errors still take precedence.
+    try:
+        for _, ev in _iter_verified(path):
+            events += 1
+            if order_error is not None:
+                continue
+            i = events
+            # Fetch each field once; the rest of the checks work on locals.
+            ev_run_id = ev.get("run_id")
+            etype = ev.get("type")
+            ehash = ev.get("hash")
+
+            if i == 1:
+                run_id = ev_run_id
+                if not run_id:
+                    order_error = "missing run_id on first event"
+                    continue
+            if ev_run_id != run_id:
+                order_error = f"mixed run_id at line {i}"
+                continue
+
+            if not etype or not ehash:
+                order_error = f"missing type/hash at line {i}"
+                continue
+
+            if i == 1:
+                if etype != "RunStarted":
+                    order_error = "first event must be RunStarted"
+                    continue
+                seen_start = True
+            else:
+                if not seen_start:
+                    order_error = "RunStarted missing"
+                    continue
+                if seen_end:
+                    order_error = "events after terminal event"
+                    continue
+
+            if etype in {"RunCompleted", "RunFailed"}:
+                seen_end = True
+
+            # Deterministic replay-state update
+            state_hash = _next_state_hash(state_hash, ehash, etype)
+    except _VerifyError as e:
+        return ReplayResult(ok=False, error=f"audit verification failed: {e}")
+
+    if events == 0:
+        return ReplayResult(ok=False, error="empty audit log")
+    if order_error is not None:
+        return ReplayResult(ok=False, error=order_error)
     if not seen_end:
         return ReplayResult(ok=False, error="missing terminal event (RunCompleted/RunFailed)")
 
-    return ReplayResult(ok=True, events=len(lines), run_id=run_id, replay_state_hash=state_hash)
+    return ReplayResult(ok=True, events=events, run_id=run_id, replay_state_hash=state_hash)
@@ -11,10 +11,12 @@ Each entry is a JSON object with fields:
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import hashlib
 import json
+import os
 import time
 
 from packages.core.codec import stable_sha256, canonical_json_bytes
@@ -22,28 +24,95 @@ from packages.core.types import AuditEvent
 from packages.policy.engine import redact_text
 
 
+# Write buffer for the persistent log handle. Lines are flushed to the OS when the
+# buffer fills, on flush()/close(), and after terminal run events.
+_BUFFER_SIZE = 64 * 1024
+_FLUSH_ON_TYPES = frozenset({"RunCompleted", "RunFailed"})
+_TAIL_BLOCK_SIZE = 4096
+
+# Canonical JSON sorts keys, so "hash" is always the first field of an event line.
+# The hashed body ({"hash":null,...}) and the written line ({"hash":"<hex>",...})
+# therefore differ only in that leading field, and can be spliced into each other.
+_NULL_HASH_PREFIX = b'{"hash":null'
+_HASH_PREFIX = b'{"hash":"'
+
+# Shared decoder for event lines. json.loads() on bytes re-checks its kwargs and
+# sniffs the encoding per call; audit lines are always UTF-8, so decode directly.
+_EVENT_DECODER = json.JSONDecoder()
+
+
+# (unix second, formatted timestamp) of the last _utc_iso() call.
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+
 def _utc_iso() -> str:
     # Keep it deterministic enough; real-time is fine here because audit is time-stamped truth.
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    # Second resolution: only reformat when the second rolls over.
+    global _TS_CACHE
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _TS_CACHE[1]
+
+
+# Payload keys whose string values are identifiers (ids, hashes, enum names), never
+# free text, so redaction skips them. Only honoured at the top level of a payload and
+# in the orchestrator-built tool_calls[*] entries; inside args/data/results they are
+# ordinary keys, since those dicts are model- or user-controlled.
+_SAFE_KEYS = frozenset({
+    "run_id", "call_id", "tool_name", "agent_type", "type",
+    "prev_hash", "hash", "attempt", "attempts",
+})
 
 
 def _redact_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Conservative redaction:
       - If a value is a string, run redact_text()
+      - Unless it is a string under a _SAFE_KEYS key of the payload itself or of a
+        tool_calls[*] entry
       - If dict/list, recurse
       - Else keep as-is
+
+    Copy-on-write: containers are only rebuilt along paths where a string actually
+    changed, so a payload with nothing to redact is returned as-is. Ordering and
+    serialization are left to the canonical encoder in the same append.
     """
+    def walk_dict(v: Dict[Any, Any], ids: bool, top: bool) -> Dict[Any, Any]:
+        out: Optional[Dict[Any, Any]] = None
+        for k, x in v.items():
+            if ids and k in _SAFE_KEYS and isinstance(x, str):
+                continue
+            if top and k == "tool_calls" and isinstance(x, list):
+                y = walk_list(x, calls=True)
+            else:
+                y = walk(x)
+            if y is not x:
+                if out is None:
+                    out = dict(v)
+                out[k] = y
+        return v if out is None else out
+
+    def walk_list(v: List[Any], calls: bool = False) -> List[Any]:
+        out_l: Optional[List[Any]] = None
+        for i, x in enumerate(v):
+            y = walk_dict(x, ids=True, top=False) if calls and isinstance(x, dict) else walk(x)
+            if y is not x:
+                if out_l is None:
+                    out_l = list(v)
+                out_l[i] = y
+        return v if out_l is None else out_l
+
     def walk(v: Any) -> Any:
         if isinstance(v, str):
             return redact_text(v)
         if isinstance(v, dict):
-            return {k: walk(v[k]) for k in v}
+            return walk_dict(v, ids=False, top=False)
         if isinstance(v, list):
-            return [walk(x) for x in v]
+            return walk_list(v)
         return v
 
-    return walk(payload)  # type: ignore[return-value]
+    return walk_dict(payload, ids=True, top=True)
 
 
 class AuditWriter:
@@ -52,6 +121,19 @@ class AuditWriter:
 
     File format: one JSON object per line:
       { run_id, type, ts_utc, payload, prev_hash, hash }
+
+    Payload strings are redacted before hashing, except top-level identifier fields
+    listed in _SAFE_KEYS (run_id, call_id, tool_name, ...) and the same fields of
+    tool_calls[*] entries; callers must not put free text there.
+
+    The log file is held open for the writer's lifetime and writes are buffered.
+    Buffered lines reach the file on flush(), close(), or after a terminal event
+    (RunCompleted / RunFailed). Use the writer as a context manager to scope it.
+
+    Readers only see flushed lines: verify_audit_log / replay_audit_log, or a second
+    AuditWriter on the same path (which recovers prev_hash from the file tail), will
+    miss buffered non-terminal events. Call flush() or close() before reading a log
+    that is still being written.
     """
 
     def __init__(self, path: Path) -> None:
@@ -61,52 +143,155 @@ class AuditWriter:
         if self.path.exists():
             # Recover last hash from file tail if present.
             self._last_hash = _read_last_hash(self.path)
+        self._prev_hash_json = canonical_json_bytes(self._last_hash)
+        self._fh = open(self.path, "ab", buffering=_BUFFER_SIZE)
+
+    def __enter__(self) -> "AuditWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def append(self, run_id: str, type: str, payload: Dict[str, Any]) -> AuditEvent:
+        ts_utc = _utc_iso()
+        payload = _redact_payload(payload)
+        # Hash must be computed over canonical representation excluding the hash field itself.
+        # Only the payload goes through the encoder; the other fields are assembled from
+        # cached fragments in canonical (sorted) key order, then the hash is spliced in.
+        body = b"".join((
+            _NULL_HASH_PREFIX,
+            b',"payload":', canonical_json_bytes(payload),
+            b',"prev_hash":', self._prev_hash_json,
+            b',"run_id":', _json_str(run_id),
+            b',"ts_utc":"', ts_utc.encode("ascii"),
+            b'","type":', _json_str(type),
+            b"}",
+        ))
+        h = hashlib.sha256(body).hexdigest()
         ev = AuditEvent(
             run_id=run_id,
             type=type,  # AuditEventType validated by caller at higher layers
-            ts_utc=_utc_iso(),
-            payload=_redact_payload(payload),
+            ts_utc=ts_utc,
+            payload=payload,
             prev_hash=self._last_hash,
-            hash=None,
+            hash=h,
         )
-        # Hash must be computed over canonical representation excluding the hash field itself.
-        ev_dict = asdict(ev)
-        ev_dict["hash"] = None
-        h = stable_sha256(ev_dict)
-        ev = AuditEvent(**{**asdict(ev), "hash": h})
-        self._write_line(ev)
+        self._write_line(_splice_hash(body, h))
         self._last_hash = h
+        self._prev_hash_json = b'"' + h.encode("ascii") + b'"'
+        if type in _FLUSH_ON_TYPES:
+            self.flush()
         return ev
 
-    def _write_line(self, ev: AuditEvent) -> None:
-        line = canonical_json_bytes(asdict(ev)).decode("utf-8")
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Push buffered lines to the OS. With fsync=True, also wait for the disk.
+        """
+        self._fh.flush()
+        if fsync:
+            os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.flush()
+            self._fh.close()
+
+    def _write_line(self, line: bytes) -> None:
+        self._fh.write(line + b"\n")
+
+
+@lru_cache(maxsize=256)
+def _json_str(s: str) -> bytes:
+    # run_id and type repeat on every event of a run; encode each value once.
+    return canonical_json_bytes(s)
+
+
+def _splice_hash(body: bytes, h: str) -> bytes:
+    return _HASH_PREFIX + h.encode("ascii") + b'"' + body[len(_NULL_HASH_PREFIX):]
+
+
+def _decode_line(line: bytes) -> Dict[str, Any]:
+    return _EVENT_DECODER.decode(line.decode("utf-8"))
+
+
+def _line_hash(line: bytes, obj: Dict[str, Any], h: Any) -> str:
+    """
+    Recompute the hash of a parsed event line whose stored hash is h.
+    Canonical lines are un-spliced and hashed as-is; anything else falls back to
+    re-serializing the parsed object.
+    """
+    if isinstance(h, str):
+        prefix = _HASH_PREFIX + h.encode("ascii", errors="replace") + b'"'
+        if line.startswith(prefix):
+            return hashlib.sha256(_NULL_HASH_PREFIX + line[len(prefix):]).hexdigest()
+    obj2 = dict(obj)
+    obj2["hash"] = None
+    return stable_sha256(obj2)
 
 
 def _read_last_hash(path: Path) -> Optional[str]:
     try:
         with path.open("rb") as f:
             f.seek(0, 2)
-            size = f.tell()
-            if size == 0:
+            pos = f.tell()
+            # Scan backward block by block until the last non-empty line is complete,
+            # so arbitrarily large events are handled and nothing else is decoded.
+            # Only the newly read block is searched, and the line's blocks are
+            # joined once at the end, so cost is linear in the last line's size.
+            parts: List[bytes] = []
+            while pos > 0:
+                step = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                if not parts:
+                    # Still inside trailing whitespace / blank lines.
+                    block = block.rstrip()
+                    if not block:
+                        continue
+                nl = block.rfind(b"\n")
+                if nl != -1:
+                    parts.append(block[nl + 1:])
+                    break
+                parts.append(block)
+            if not parts:
                 return None
-            # Read last ~8KB for tail scan (enough for last line)
-            f.seek(max(0, size - 8192))
-            tail = f.read().decode("utf-8", errors="ignore").splitlines()
-            for line in reversed(tail):
-                line = line.strip()
-                if not line:
-                    continue
-                obj = json.loads(line)
-                return obj.get("hash")
+            parts.reverse()
+            obj = _decode_line(b"".join(parts))
+            return obj.get("hash")
     except Exception:
         return None
     return None
 
 
+class _VerifyError(Exception):
+    pass
+
+
+def _iter_verified(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Stream (line_no, event) for each non-blank line of the log, checking the hash
+    chain as it goes. Raises _VerifyError on the first broken link.
+    """
+    prev: Optional[str] = None
+    with path.open("rb") as f:
+        for line_no, raw in enumerate(f, start=1):
+            line = raw.strip()
+            if not line:
+                continue
+            obj = _decode_line(line)
+            # Check prev hash consistency
+            if obj.get("prev_hash") != prev:
+                raise _VerifyError(f"prev_hash mismatch at line {line_no}")
+            # Recompute hash
+            expected_hash = obj.get("hash")
+            actual = _line_hash(line, obj, expected_hash)
+            if expected_hash != actual:
+                raise _VerifyError(f"hash mismatch at line {line_no}")
+            prev = expected_hash
+            yield line_no, obj
+
+
 def verify_audit_log(path: Path) -> Tuple[bool, Optional[str]]:
     """
     Verify hash chain and hashes.
@@ -115,21 +300,9 @@ def verify_audit_log(path: Path) -> Tuple[bool, Optional[str]]:
     if not path.exists():
         return False, "audit log does not exist"
 
-    prev: Optional[str] = None
-    line_no = 0
-    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        if not line.strip():
-            continue
-        obj = json.loads(line)
-        # Check prev hash consistency
-        if obj.get("prev_hash") != prev:
-            return False, f"prev_hash mismatch at line {line_no}"
-        # Recompute hash
-        expected_hash = obj.get("hash")
-        obj2 = dict(obj)
-        obj2["hash"] = None
-        actual = stable_sha256(obj2)
-        if expected_hash != actual:
-            return False, f"hash mismatch at line {line_no}"
-        prev = expected_hash
-    return True, None
\ No newline at end of file
+    try:
+        for _ in _iter_verified(path):
+            pass
+    except _VerifyError as e:
+        return False, str(e)
+    return True, None
@@ -6,10 +6,20 @@ from __future__ import annotations
 
 import json
 import hashlib
-from dataclasses import asdict, is_dataclass
-from typing import Any
+from dataclasses import asdict, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Tuple
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    # Per-class field names for _encode_default, so fields() is not re-walked per object.
+    return tuple(f.name for f in fields(cls))
 
 def canonicalize(obj: Any) -> Any:
+    """
+    Legacy Python-level canonicalization (sorted dicts, dataclasses as dicts).
+    canonical_json_bytes() no longer uses it; kept as the reference form.
+    """
     if is_dataclass(obj):
         return canonicalize(asdict(obj))
     if isinstance(obj, dict):
@@ -18,10 +28,24 @@ def canonicalize(obj: Any) -> Any:
         return [canonicalize(x) for x in obj]
     return obj
 
+def _encode_default(obj: Any) -> Any:
+    # Only reached for values json cannot encode natively. Dataclasses become a
+    # shallow field dict; the encoder recurses into (and key-sorts) the values.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {k: getattr(obj, k) for k in _field_names(type(obj))}
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+# Single C-backed encoder: sort_keys gives the same byte output as encoding
+# canonicalize(obj), without the Python-level recursion.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    default=_encode_default,
+)
+
 def canonical_json_bytes(obj: Any) -> bytes:
-    canon = canonicalize(obj)
-    s = json.dumps(canon, separators=(",", ":"), ensure_ascii=False)
-    return s.encode("utf-8")
+    return _CANONICAL_ENCODER.encode(obj).encode("utf-8")
 
 def stable_sha256(obj: Any) -> str:
     return hashlib.sha256(canonical_json_bytes(obj)).hexdigest()
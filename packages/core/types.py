@@ -15,28 +15,28 @@ class AgentType(str, Enum):
     executor = "executor"
     critic = "critic"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskRequest:
     run_id: RunId
     task_id: str
     user_intent: str
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolPlan:
     run_id: RunId
     agent_type: AgentType
     tool_calls: List[ToolCall] = field(default_factory=list)
     note: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     run_id: RunId
     tool_name: str
     args: Dict[str, Any]
     call_id: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolResult:
     run_id: RunId
     call_id: str
@@ -44,26 +44,26 @@ class ToolResult:
     result: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     run_id: RunId
     ok: bool
     tool_results: List[ToolResult] = field(default_factory=list)
     error: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelRequest:
     run_id: RunId
     agent_type: AgentType
     input: Dict[str, Any]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelReply:
     run_id: RunId
     agent_type: AgentType
     output: Dict[str, Any]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDelta:
     run_id: RunId
     patches: List[Dict[str, Any]]  # json-patch-like (op/path/value)
@@ -85,7 +85,7 @@ AuditEventType = Literal[
     "CriticReport",
 ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEvent:
     run_id: RunId
     type: AuditEventType
@@ -94,7 +94,7 @@ class AuditEvent:
     prev_hash: Optional[str] = None
     hash: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObservationEvent:
     run_id: RunId
     kind: str  # e.g. "text", "file"
@@ -105,7 +105,7 @@ class CriticDecision(str, Enum):
     retry = "retry"
     failed = "failed"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CriticReport:
     run_id: RunId
     decision: CriticDecision
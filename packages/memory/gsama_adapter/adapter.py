@@ -7,10 +7,12 @@ Contract:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+import hashlib
 import json
+import os
 
 from packages.core.codec import canonical_json_bytes
 from packages.core.types import StateDelta
@@ -31,17 +33,27 @@ class GsamaAdapter:
 
     state_path: Path
     _state: Dict[str, Any]
+    # sha256 of the bytes last written to / read from state_path.
+    _persisted_hash: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def snapshot(self) -> Dict[str, Any]:
         # Return a deep-ish copy to avoid accidental mutation by callers.
-        return json.loads(json.dumps(self._state))
+        return _copy_tree(self._state)
 
     def serialize(self) -> bytes:
         return canonical_json_bytes(self._state)
 
     def persist(self) -> None:
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_bytes(self.serialize())
+        """
+        Atomically replace the state file. Skipped when the serialized state matches
+        what is already on disk.
+        """
+        blob = self.serialize()
+        h = hashlib.sha256(blob).digest()
+        if h == self._persisted_hash:
+            return
+        _atomic_write(self.state_path, blob)
+        self._persisted_hash = h
 
     def apply_delta(self, delta: StateDelta) -> None:
         """
@@ -61,6 +73,34 @@ class GsamaAdapter:
         self.persist()
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    # Write a sibling temp file, fsync it, then rename over the target, so a crash
+    # leaves either the old or the new state, never a truncated file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if os.name == "posix":
+        # Make the rename itself durable.
+        fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _copy_tree(v: Any) -> Any:
+    # State is JSON-shaped: only dicts and lists are mutable, scalars can be shared.
+    if isinstance(v, dict):
+        return {k: _copy_tree(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_copy_tree(x) for x in v]
+    return v
+
+
 def _set_dot_path(d: Dict[str, Any], path: str, value: Any) -> None:
     parts = path.split(".")
     cur: Dict[str, Any] = d
@@ -81,7 +121,8 @@ def load_or_init(path: Path) -> GsamaAdapter:
     Stage 2A is strictly the persistence + boundary + import fence.
     """
     if path.exists():
-        raw = path.read_text(encoding="utf-8")
+        raw_bytes = path.read_bytes()
+        raw = raw_bytes.decode("utf-8")
         state = json.loads(raw) if raw.strip() else {}
     else:
         state = {
@@ -90,6 +131,6 @@ def load_or_init(path: Path) -> GsamaAdapter:
                 "notes": "Initialized by pieBot gsama_adapter. Vendor wiring comes in Stage 2+.",
             },
         }
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(canonical_json_bytes(state))
-    return GsamaAdapter(state_path=path, _state=state)
\ No newline at end of file
+        raw_bytes = canonical_json_bytes(state)
+        _atomic_write(path, raw_bytes)
+    return GsamaAdapter(state_path=path, _state=state, _persisted_hash=hashlib.sha256(raw_bytes).digest())
\ No newline at end of file
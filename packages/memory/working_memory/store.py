@@ -9,7 +9,10 @@ Contains:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+import heapq
+import math
+import sys
 import time
 
 
@@ -17,26 +20,48 @@ class WorkingMemoryFull(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class _Entry:
     value: Any
-    expires_at: float
+    expires_at: int  # time.monotonic_ns() deadline
     run_id: Optional[str]
     approx_bytes: int
 
 
-def _now() -> float:
-    return time.time()
-
-
-def _approx_size(value: Any) -> int:
-    # Cheap + deterministic-ish sizing. We don't want deep recursion here.
-    # Enough to enforce a cap and fail closed.
-    try:
-        s = repr(value)
-    except Exception:
-        s = "<unrepr>"
-    return len(s.encode("utf-8", errors="ignore"))
+def _now() -> int:
+    # Monotonic so wall-clock jumps cannot expire or resurrect entries; integer ns
+    # keeps the heap comparisons on ints.
+    return time.monotonic_ns()
+
+
+def _approx_size(value: Any, limit: int) -> int:
+    # Cheap + deterministic-ish sizing, enough to enforce a cap and fail closed:
+    # strings by UTF-8 length, bytes by length, containers by their own getsizeof
+    # plus their (recursively sized) children, everything else by getsizeof.
+    # The walk stops as soon as the total passes `limit`, so cost is
+    # O(min(size, limit)); any result > limit just means "too big".
+    total = 0
+    stack = [value]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, str):
+            # A str encodes to at least len(v) bytes; skip the encode when that
+            # alone is over the limit.
+            n = len(v)
+            total += n if total + n > limit else len(v.encode("utf-8", errors="surrogatepass"))
+        elif isinstance(v, (bytes, bytearray)):
+            total += len(v)
+        else:
+            total += sys.getsizeof(v)
+            if isinstance(v, dict):
+                for k, x in v.items():
+                    stack.append(k)
+                    stack.append(x)
+            elif isinstance(v, (list, tuple, set, frozenset)):
+                stack.extend(v)
+        if total > limit:
+            break
+    return total
 
 
 class WorkingMemory:
@@ -56,17 +81,38 @@ class WorkingMemory:
         self.max_bytes = max_bytes
         self._items: Dict[str, _Entry] = {}
         self._bytes_used = 0
+        # Min-heap of (expires_at, seq, key). Entries are deleted lazily: a popped
+        # entry whose key was dropped or overwritten with a later expiry is skipped.
+        self._expiry_heap: List[Tuple[int, int, str]] = []
+        self._seq = 0
+        # run_id -> keys stored under it, so clear_run touches only that run's keys.
+        self._by_run: Dict[str, Set[str]] = {}
 
     def _evict_expired(self) -> None:
         t = _now()
-        expired = [k for k, e in self._items.items() if e.expires_at <= t]
-        for k in expired:
-            self._drop(k)
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= t:
+            _, _, k = heapq.heappop(heap)
+            e = self._items.get(k)
+            if e is not None and e.expires_at <= t:
+                self._drop(k)
+
+    def _compact_heap(self) -> None:
+        # Overwrites leave stale heap entries behind; rebuild once they dominate.
+        self._expiry_heap = [(e.expires_at, i, k) for i, (k, e) in enumerate(self._items.items())]
+        heapq.heapify(self._expiry_heap)
+        self._seq = len(self._expiry_heap)
 
     def _drop(self, key: str) -> None:
         e = self._items.pop(key, None)
         if e is not None:
             self._bytes_used = max(0, self._bytes_used - e.approx_bytes)
+            if e.run_id is not None:
+                keys = self._by_run.get(e.run_id)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._by_run[e.run_id]
 
     def get(self, key: str) -> Optional[Any]:
         self._evict_expired()
@@ -76,14 +122,17 @@ class WorkingMemory:
         return e.value
 
     def set(self, key: str, value: Any, ttl_seconds: float, run_id: Optional[str] = None) -> bool:
-        if ttl_seconds <= 0:
-            # Fail closed: don't store garbage entries.
+        if not ttl_seconds > 0:
+            # Fail closed: don't store garbage entries (this also rejects NaN).
             return False
 
         self._evict_expired()
 
-        approx = _approx_size(value)
-        expires_at = _now() + float(ttl_seconds)
+        if math.isinf(ttl_seconds):
+            # Never expires; int(inf) would raise.
+            expires_at = sys.maxsize
+        else:
+            expires_at = _now() + int(ttl_seconds * 1_000_000_000)
 
         # If overwriting, remove old first so accounting is correct.
         if key in self._items:
@@ -92,22 +141,30 @@ class WorkingMemory:
         # Hard cap checks (fail closed).
         if len(self._items) + 1 > self.max_entries:
             return False
+        approx = _approx_size(value, self.max_bytes - self._bytes_used)
         if self._bytes_used + approx > self.max_bytes:
             return False
 
         self._items[key] = _Entry(value=value, expires_at=expires_at, run_id=run_id, approx_bytes=approx)
         self._bytes_used += approx
+        if run_id is not None:
+            self._by_run.setdefault(run_id, set()).add(key)
+        heapq.heappush(self._expiry_heap, (expires_at, self._seq, key))
+        self._seq += 1
+        if len(self._expiry_heap) > 2 * self.max_entries:
+            self._compact_heap()
         return True
 
     def clear_run(self, run_id: str) -> None:
         self._evict_expired()
-        doomed = [k for k, e in self._items.items() if e.run_id == run_id]
-        for k in doomed:
+        for k in list(self._by_run.get(run_id, ())):
             self._drop(k)
 
     def clear_all(self) -> None:
         self._items.clear()
         self._bytes_used = 0
+        self._expiry_heap.clear()
+        self._by_run.clear()
 
     def stats(self) -> Dict[str, Any]:
         self._evict_expired()
@@ -18,7 +18,7 @@ import os
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -42,6 +42,7 @@ def run_rust_redact_only(
     ts_prepared: float = 0.0,
     ts_redacted: float = 0.0,
     rust_dir: Optional[Path] = None,
+    control_bin: Optional[Path] = None,
 ) -> RustRedactionResult:
     """
     Call the Rust CLI: pie-control redact-only ...
@@ -49,17 +50,11 @@ def run_rust_redact_only(
     NOTE:
     - This function does not validate redaction. Rust does.
     - This function does not parse/inspect pre-redaction content beyond passing a filepath.
+    - With control_bin (or PIE_CONTROL_BIN) set to a prebuilt pie-control binary, it is
+      executed directly instead of going through `cargo run` on every call.
     """
     rust_dir = rust_dir or (repo_root / "rust")
-    cmd = [
-        "cargo",
-        "run",
-        "-q",
-        "-p",
-        "pie_control_cli",
-        "--bin",
-        "pie-control",
-        "--",
+    cmd = _control_cmd(control_bin, rust_dir) + [
         "redact-only",
         "--repo-root",
         str(repo_root),
@@ -108,4 +103,39 @@ def run_rust_redact_only(
         pre_hash=data["pre_hash"],
         post_hash=data["post_hash"],
         transform_log_hash=data["transform_log_hash"],
-    )
\ No newline at end of file
+    )
+
+
+def _control_cmd(control_bin: Optional[Path], rust_dir: Path) -> List[str]:
+    """
+    Command prefix for invoking pie-control.
+    A prebuilt binary skips cargo's per-call manifest resolution and freshness checks.
+    Order: explicit control_bin / PIE_CONTROL_BIN, then an up-to-date binary under
+    rust_dir/target, then `cargo run` (which builds on demand).
+    """
+    bin_path = control_bin or os.environ.get("PIE_CONTROL_BIN") or _fresh_target_bin(rust_dir)
+    if bin_path:
+        return [str(bin_path)]
+    return ["cargo", "run", "-q", "-p", "pie_control_cli", "--bin", "pie-control", "--"]
+
+
+def _fresh_target_bin(rust_dir: Path) -> Optional[Path]:
+    """
+    target/{release,debug}/pie-control, if it is at least as new as every workspace
+    manifest and Rust source file. Otherwise None, so cargo rebuilds it.
+    """
+    name = "pie-control.exe" if os.name == "nt" else "pie-control"
+    candidates = [rust_dir / "target" / profile / name for profile in ("release", "debug")]
+    built = [(c.stat().st_mtime_ns, c) for c in candidates if c.is_file()]
+    if not built:
+        return None
+
+    sources = [rust_dir / "Cargo.toml", rust_dir / "Cargo.lock"]
+    sources += (rust_dir / "crates").glob("*/Cargo.toml")
+    sources += (rust_dir / "crates").glob("*/src/**/*.rs")
+    newest_src = max((f.stat().st_mtime_ns for f in sources if f.is_file()), default=0)
+
+    for mtime, c in built:
+        if mtime >= newest_src:
+            return c
+    return None
@@ -5,20 +5,33 @@ Routes roles to model specifications and backends.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Tuple
 
 import yaml  # requires pyyaml
 
+try:
+    # libyaml-backed loader when pyyaml was built with it; same safe schema.
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - depends on the pyyaml build
+    from yaml import SafeLoader as _Loader
+
 from packages.models.profiles import ModelSpec, RoutingSpec
 from packages.models.backends.null_backend import NullBackend
 
 
+# path -> ((st_mtime_ns, st_size), router) for the last parse of each config file.
+_ROUTER_CACHE: Dict[Path, Tuple[Tuple[int, int], "ModelRouter"]] = {}
+
+
 @dataclass
 class ModelRouter:
     models: Dict[str, ModelSpec]
     routing: RoutingSpec
+    # role -> backend instance, prebuilt by load(); backends are stateless, so one per
+    # role is shared.
+    _backends: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @staticmethod
     def _norm_scalar(v: Any) -> str:
@@ -33,7 +46,22 @@ class ModelRouter:
 
     @classmethod
     def load(cls, path: Path) -> "ModelRouter":
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        """
+        Parse router.yaml. Loading an unchanged file again (same mtime and size)
+        returns the previously built router instead of re-parsing.
+        """
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _ROUTER_CACHE.get(path)
+        if cached is not None and cached[0] == key and type(cached[1]) is cls:
+            return cached[1]
+        router = cls._parse(path)
+        _ROUTER_CACHE[path] = (key, router)
+        return router
+
+    @classmethod
+    def _parse(cls, path: Path) -> "ModelRouter":
+        data = yaml.load(path.read_bytes(), Loader=_Loader) or {}
         models_raw = (data.get("models") or {})
         routing_raw = (data.get("routing") or {})
 
@@ -49,12 +77,21 @@ class ModelRouter:
 
 
         routing = RoutingSpec(mapping={cls._norm_scalar(k): cls._norm_scalar(v) for k, v in routing_raw.items()})
-        return cls(models=models, routing=routing)
+        router = cls(models=models, routing=routing)
+        # Build every routed backend now: role dispatch is then a single dict lookup,
+        # and a bad route (undefined model, unsupported kind) fails at load, not mid-run.
+        for role in routing.mapping:
+            router.get_backend_for_role(role)
+        return router
 
     def get_backend_for_role(self, role: str):
         """
         Resolve a role (e.g. 'planner') into a backend instance.
         """
+        backend = self._backends.get(role)
+        if backend is not None:
+            return backend
+
         model_name = self.routing.mapping.get(role)
         if not model_name:
             raise KeyError(f"no model routed for role: {role}")
@@ -64,6 +101,7 @@ class ModelRouter:
             raise KeyError(f"routed model not defined: role={role} model={model_name}")
 
         if spec.kind == "null":
-            return NullBackend()
+            backend = self._backends[role] = NullBackend()
+            return backend
 
         raise NotImplementedError(f"model kind not implemented: {spec.kind}")
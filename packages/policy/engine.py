@@ -38,15 +38,38 @@ REDACT_PATTERNS = [
     re.compile(r"(?i)sk-[A-Za-z0-9]{20,}"),
 ]
 
+# Literals every REDACT_PATTERNS match must contain (case-insensitively). Keep in sync.
+_REDACT_HINTS = ("key", "authorization", "sk-")
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter.
+_IGNORECASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
 def redact_text(s: str) -> str:
+    # Prefilter: most strings contain none of the literals, and a lower() plus a few
+    # substring checks is much cheaper than running the case-insensitive patterns.
+    low = s.lower() if s.isascii() else s.translate(_IGNORECASE_FOLD).lower()
+    if not any(h in low for h in _REDACT_HINTS):
+        return s
     out = s
     for pat in REDACT_PATTERNS:
         out = pat.sub("[REDACTED]", out)
     return out
 
+# decide() has a fixed set of outcomes; PolicyDecision is frozen, so share them.
+_READ_OK = PolicyDecision(True, "READ allowed by default", False)
+_EXEC_DENIED = PolicyDecision(False, "EXEC denied by default (ALLOW_EXEC=false)", False)
+_NETWORK_DENIED = PolicyDecision(False, "NETWORK denied by default (ALLOW_NETWORK=false)", False)
+_WRITE_DENIED = PolicyDecision(False, "WRITE denied (EXECUTION_ARM=false)", True)
+_UNKNOWN_RISK = PolicyDecision(False, "Unknown risk class", False)
+_ALLOWED_WITH_APPROVAL = {
+    r: PolicyDecision(True, f"{r.value} allowed by config; approval required", True)
+    for r in (RiskClass.WRITE, RiskClass.EXEC, RiskClass.NETWORK)
+}
+
+_TRUE = frozenset({"1", "true", "yes", "y", "on"})
+
 def env_flag(name: str, default: str = "false") -> bool:
     v = os.environ.get(name, default).strip().lower()
-    return v in {"1", "true", "yes", "y", "on"}
+    return v in _TRUE
 
 class PolicyEngine:
     """
@@ -54,6 +77,9 @@ class PolicyEngine:
       - EXEC denied unless ALLOW_EXEC=true
       - NETWORK denied unless ALLOW_NETWORK=true
       - WRITE denied unless EXECUTION_ARM=true (+ approval)
+
+    Flags are read from the environment at construction; call refresh() to
+    pick up later changes.
     """
     def __init__(
         self,
@@ -64,27 +90,38 @@ class PolicyEngine:
         self.execution_arm_env = execution_arm_env
         self.allow_exec_env = allow_exec_env
         self.allow_network_env = allow_network_env
+        self.refresh()
 
-    def decide(self, tool_name: str, risk: RiskClass, args: Optional[Dict[str, Any]] = None) -> PolicyDecision:
-        args = args or {}
-        armed = env_flag(self.execution_arm_env, "false")
-        allow_exec = env_flag(self.allow_exec_env, "false")
-        allow_network = env_flag(self.allow_network_env, "false")
+    def refresh(self) -> None:
+        """
+        Re-read the policy flags from the environment.
+        """
+        self._armed = env_flag(self.execution_arm_env, "false")
+        self._allow_exec = env_flag(self.allow_exec_env, "false")
+        self._allow_network = env_flag(self.allow_network_env, "false")
 
+    def decide(self, tool_name: str, risk: RiskClass, args: Optional[Dict[str, Any]] = None) -> PolicyDecision:
+        # READ is the common case and never depends on flags or args.
         if risk == RiskClass.READ:
-            return PolicyDecision(True, "READ allowed by default", False)
+            return _READ_OK
+
+        args = args or {}
+        armed = self._armed
+        allow_exec = self._allow_exec
+        allow_network = self._allow_network
 
         if risk == RiskClass.EXEC and not allow_exec:
-            return PolicyDecision(False, "EXEC denied by default (ALLOW_EXEC=false)", False)
+            return _EXEC_DENIED
 
         if risk == RiskClass.NETWORK and not allow_network:
-            return PolicyDecision(False, "NETWORK denied by default (ALLOW_NETWORK=false)", False)
+            return _NETWORK_DENIED
 
         if risk == RiskClass.WRITE and not armed:
-            return PolicyDecision(False, "WRITE denied (EXECUTION_ARM=false)", True)
+            return _WRITE_DENIED
 
         # If we are here, risk is allowed by config, but may still require approval for mutation.
-        if risk in {RiskClass.WRITE, RiskClass.EXEC, RiskClass.NETWORK}:
-            return PolicyDecision(True, f"{risk.value} allowed by config; approval required", True)
+        allowed = _ALLOWED_WITH_APPROVAL.get(risk)
+        if allowed is not None:
+            return allowed
 
-        return PolicyDecision(False, "Unknown risk class", False)
\ No newline at end of file
+        return _UNKNOWN_RISK
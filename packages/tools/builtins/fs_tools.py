@@ -4,6 +4,8 @@ Filesystem tools for reading files and listing directories within the repository
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 from typing import Any, Dict
 
@@ -11,30 +13,33 @@ from packages.policy.engine import RiskClass
 from packages.tools.registry import ToolSpec, ToolContext
 
 
-def _resolve_under(root: Path, rel: str) -> Path:
-    p = (root / rel).resolve()
-    r = root.resolve()
-    if r not in p.parents and p != r:
+def _resolve_under(r: Path, rel: str) -> Path:
+    # r must already be resolved (ToolContext.repo_root_resolved).
+    p = (r / rel).resolve()
+    if not p.is_relative_to(r):
         raise ValueError("path escapes repo root")
     return p
 
 
 def _list_dir(args: Dict[str, Any], ctx: ToolContext) -> Dict[str, Any]:
     rel = str(args.get("path", "."))
-    p = _resolve_under(ctx.repo_root, rel)
+    p = _resolve_under(ctx.repo_root_resolved, rel)
     if not p.exists():
         raise FileNotFoundError(rel)
     if not p.is_dir():
         raise NotADirectoryError(rel)
-    items = []
-    for child in sorted(p.iterdir(), key=lambda x: x.name):
-        items.append(
-            {
-                "name": child.name,
-                "is_dir": child.is_dir(),
-                "is_file": child.is_file(),
-            }
-        )
+    # scandir entries answer is_dir()/is_file() from the directory read itself
+    # (only symlinks need a stat), instead of two stats per child.
+    with os.scandir(p) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    items = [
+        {
+            "name": e.name,
+            "is_dir": e.is_dir(),
+            "is_file": e.is_file(),
+        }
+        for e in entries
+    ]
     return {"path": rel, "items": items}
 
 
@@ -43,15 +48,25 @@ def _read_file(args: Dict[str, Any], ctx: ToolContext) -> Dict[str, Any]:
     if not rel:
         raise ValueError("missing path")
     max_bytes = int(args.get("max_bytes", 1_000_000))
-    p = _resolve_under(ctx.repo_root, rel)
-    if not p.exists():
-        raise FileNotFoundError(rel)
-    if not p.is_file():
+    p = _resolve_under(ctx.repo_root_resolved, rel)
+    try:
+        st = p.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(rel) from None
+    if not stat.S_ISREG(st.st_mode):
         raise IsADirectoryError(rel)
-    size = p.stat().st_size
+    if st.st_size > max_bytes:
+        raise ValueError(f"file too large: {st.st_size} > {max_bytes}")
+    # Bounded read: the cap holds even if the file grew after the stat.
+    with p.open("rb") as f:
+        raw = f.read(max_bytes + 1)
+    size = len(raw)
     if size > max_bytes:
-        raise ValueError(f"file too large: {size} > {max_bytes}")
-    data = p.read_text(encoding="utf-8", errors="replace")
+        raise ValueError(f"file too large: > {max_bytes}")
+    data = raw.decode("utf-8", errors="replace")
+    if "\r" in data:
+        # Same universal-newline translation read_text() applied.
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
     return {"path": rel, "size": size, "text": data}
 
 
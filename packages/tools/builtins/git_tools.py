@@ -28,17 +28,19 @@ def _git_diff(args: Dict[str, Any], ctx: ToolContext) -> Dict[str, Any]:
     if paths:
         cmd += ["--"] + [str(p) for p in paths]
 
+    # Capture raw bytes and decode once; text mode would add a newline-translation
+    # pass and fail outright on non-UTF-8 content in the diff.
     p = subprocess.run(
         cmd,
         cwd=str(ctx.repo_root),
         capture_output=True,
-        text=True,
     )
     # git diff returns 0 even if diff exists; nonzero indicates error
     if p.returncode not in (0,):
-        raise RuntimeError((p.stderr or p.stdout).strip() or f"git diff failed: {p.returncode}")
+        err = (p.stderr or p.stdout).decode("utf-8", errors="replace").strip()
+        raise RuntimeError(err or f"git diff failed: {p.returncode}")
 
-    return {"diff": p.stdout}
+    return {"diff": p.stdout.decode("utf-8", errors="replace")}
 
 
 git_diff_spec = ToolSpec(
@@ -55,13 +57,10 @@ Git apply_patch tool.
 def _resolve_under(root: Path, rel: str) -> Path:
     p = (root / rel).resolve()
     r = root.resolve()
-    if r not in p.parents and p != r:
+    if not p.is_relative_to(r):
         raise ValueError("path escapes runtime root")
     return p
 
-def _sha256_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
-
 def _apply_patch(args: Dict[str, Any], ctx: ToolContext) -> Dict[str, Any]:
     diff_file = str(args.get("diff_file") or "").strip()
     token = args.get("approval_token")
@@ -80,8 +79,10 @@ def _apply_patch(args: Dict[str, Any], ctx: ToolContext) -> Dict[str, Any]:
     if not patch_path.is_file():
         raise ValueError("diff_file is not a file")
 
-    data = patch_path.read_bytes()
-    diff_hash = _sha256_bytes(data)
+    # Hash straight from the file; git apply reads the patch itself, so the bytes
+    # never need to be held in memory here.
+    with patch_path.open("rb") as f:
+        diff_hash = hashlib.file_digest(f, "sha256").hexdigest()
 
     p = subprocess.run(
         ["git", "apply", "--whitespace=nowarn", str(patch_path)],
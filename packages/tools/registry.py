@@ -5,11 +5,12 @@ Must go through a central registry for policy enforcement and auditing.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
+import os
+import threading
 import traceback
-import uuid
 
 from packages.core.types import ToolResult
 from packages.policy.engine import PolicyEngine, RiskClass
@@ -20,6 +21,43 @@ from packages.tools.store import store_tool_result
 
 ToolHandler = Callable[[Dict[str, Any], "ToolContext"], Dict[str, Any]]
 
+# Random bytes for call ids, drawn from the OS in blocks rather than one
+# getrandom() per invocation as uuid.uuid4() does.
+_CALL_ID_BYTES = 16
+_CALL_ID_POOL_SIZE = _CALL_ID_BYTES * 256
+_call_id_pool = bytearray()
+_call_id_lock = threading.Lock()
+
+
+def _next_call_id() -> str:
+    """
+    128-bit random hex id (same length as uuid4().hex).
+    """
+    global _call_id_pool
+    with _call_id_lock:
+        if not _call_id_pool:
+            _call_id_pool = bytearray(os.urandom(_CALL_ID_POOL_SIZE))
+        chunk = _call_id_pool[-_CALL_ID_BYTES:]
+        del _call_id_pool[-_CALL_ID_BYTES:]
+    return chunk.hex()
+
+
+def _reset_call_id_pool() -> None:
+    # A forked child must not hand out the ids left in its parent's pool, nor
+    # inherit the lock in a held state.
+    global _call_id_pool, _call_id_lock
+    _call_id_pool = bytearray()
+    _call_id_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_call_id_pool)
+
+
+# Errors handlers raise on purpose for bad input (missing paths, limits, escapes).
+# The message says it all, so these results carry no traceback.
+_EXPECTED_EXC = (FileNotFoundError, NotADirectoryError, IsADirectoryError, PermissionError, ValueError)
+
 
 @dataclass(frozen=True)
 class ToolSpec:
@@ -33,6 +71,11 @@ class ToolSpec:
 class ToolContext:
     repo_root: Path
     runtime_root: Path
+    # repo_root.resolve(), computed once so tools don't re-resolve it on every call.
+    repo_root_resolved: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "repo_root_resolved", self.repo_root.resolve())
 
 
 class ToolRegistry:
@@ -66,8 +109,16 @@ class ToolRegistry:
         return self._tools.get(name)
 
     def invoke(self, *, run_id: str, tool_name: str, args: Dict[str, Any]) -> ToolResult:
+        try:
+            return self._invoke(run_id=run_id, tool_name=tool_name, args=args)
+        finally:
+            # Each invocation is a durability boundary: its audit trail must be on disk
+            # alongside the stored artifact.
+            self._audit.flush()
+
+    def _invoke(self, *, run_id: str, tool_name: str, args: Dict[str, Any]) -> ToolResult:
         spec = self._tools.get(tool_name)
-        call_id = uuid.uuid4().hex
+        call_id = _next_call_id()
 
         if spec is None:
             self._audit.append(run_id, "ToolExecuted", {"tool_name": tool_name, "call_id": call_id, "args": args})
@@ -211,12 +262,11 @@ class ToolRegistry:
             out = spec.handler(args, self._ctx)
             res = ToolResult(run_id=run_id, call_id=call_id, ok=True, result=out, error=None)
         except Exception as e:
-            tb = traceback.format_exc(limit=3)
             res = ToolResult(
                 run_id=run_id,
                 call_id=call_id,
                 ok=False,
-                result={"traceback": tb},
+                result={} if isinstance(e, _EXPECTED_EXC) else {"traceback": traceback.format_exc(limit=3)},
                 error=f"{e.__class__.__name__}: {e}",
             )
 
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -73,34 +75,42 @@ def iter_repo_text_files() -> list[Path]:
             files.append(p)
     return files
 
+def _read_bytes(p: Path) -> bytes | None:
+    try:
+        return p.read_bytes()
+    except Exception:
+        return None
+
+@lru_cache(maxsize=None)
+def read_repo_text_files() -> tuple[tuple[str, str], ...]:
+    # (repo-relative path, decoded text) for every scanned file, read and decoded
+    # once and shared by the content checks below. Matching runs on str so \s and
+    # (?i) keep their Unicode semantics. Reads run on a thread pool (file I/O
+    # releases the GIL); matching stays sequential, since re holds it.
+    paths = iter_repo_text_files()
+    with ThreadPoolExecutor() as ex:
+        blobs = list(ex.map(_read_bytes, paths))
+    return tuple(
+        (str(p.relative_to(ROOT)), data.decode("utf-8", errors="ignore"))
+        for p, data in zip(paths, blobs)
+        if data is not None
+    )
+
 def check_no_secrets() -> None:
     offenders: list[str] = []
-    for p in iter_repo_text_files():
-        try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        for pat in SECRET_PATTERNS:
-            if pat.search(text):
-                offenders.append(str(p.relative_to(ROOT)))
-                break
+    for rel, text in read_repo_text_files():
+        if any(pat.search(text) for pat in SECRET_PATTERNS):
+            offenders.append(rel)
     if offenders:
         fail(f"Potential secrets detected in: {sorted(set(offenders))}")
 
 def check_no_public_bind_defaults() -> None:
     offenders: list[str] = []
-    for p in iter_repo_text_files():
-        rel = str(p.relative_to(ROOT))
+    for rel, text in read_repo_text_files():
         if rel in SKIP_PUBLIC_BIND_SCAN:
             continue
-        try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        for pat in PUBLIC_BIND_PATTERNS:
-            if pat.search(text):
-                offenders.append(rel)
-                break
+        if any(pat.search(text) for pat in PUBLIC_BIND_PATTERNS):
+            offenders.append(rel)
     if offenders:
         fail(
             "Public bind patterns found (0.0.0.0 / ::). Default must be localhost-only. "
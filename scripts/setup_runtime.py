@@ -7,12 +7,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# Leaf directories only; mkdir(parents=True) creates runtime/, runtime/memory and
+# runtime/artifacts on the way.
 RUNTIME_DIRS = [
     "runtime/state",
-    "runtime/memory",
     "runtime/memory/episodes",
     "runtime/logs",
-    "runtime/artifacts",
     "runtime/artifacts/diffs",
 ]
 
@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.models import ModelRouter
+
+
+NULL_ROUTER_YAML = """
+models:
+  null:
+    kind: null
+    capabilities: []
+routing:
+  planner: null
+  executor: null
+  critic: null
+""".strip()
+
+
+@pytest.fixture(scope="session")
+def null_router(tmp_path_factory: pytest.TempPathFactory) -> ModelRouter:
+    # Parsed once per session; the null backend is stateless, so tests can share it.
+    cfg = tmp_path_factory.mktemp("router") / "router.yaml"
+    cfg.write_text(NULL_ROUTER_YAML, encoding="utf-8")
+    return ModelRouter.load(cfg)
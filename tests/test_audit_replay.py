@@ -8,10 +8,10 @@ from packages.core.audit import AuditWriter, replay_audit_log
 
 def test_replay_passes(tmp_path: Path):
     log = tmp_path / "runtime" / "logs" / "audit.jsonl"
-    w = AuditWriter(log)
-    w.append("r1", "RunStarted", {"x": "y"})
-    w.append("r1", "ObservationCaptured", {"obs": 1})
-    w.append("r1", "RunCompleted", {"ok": True})
+    with AuditWriter(log) as w:
+        w.append("r1", "RunStarted", {"x": "y"})
+        w.append("r1", "ObservationCaptured", {"obs": 1})
+        w.append("r1", "RunCompleted", {"ok": True})
     res = replay_audit_log(log)
     assert res.ok is True
     assert res.events == 3
@@ -20,10 +20,10 @@ def test_replay_passes(tmp_path: Path):
 
 def test_replay_fails_on_order_change(tmp_path: Path):
     log = tmp_path / "runtime" / "logs" / "audit.jsonl"
-    w = AuditWriter(log)
-    w.append("r1", "RunStarted", {"x": "y"})
-    w.append("r1", "ObservationCaptured", {"obs": 1})
-    w.append("r1", "RunCompleted", {"ok": True})
+    with AuditWriter(log) as w:
+        w.append("r1", "RunStarted", {"x": "y"})
+        w.append("r1", "ObservationCaptured", {"obs": 1})
+        w.append("r1", "RunCompleted", {"ok": True})
 
     lines = log.read_text(encoding="utf-8").splitlines()
     # Swap lines 2 and 3 (breaks: terminal not last, hashes also inconsistent after verify)
@@ -31,4 +31,27 @@ def test_replay_fails_on_order_change(tmp_path: Path):
     log.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
     res = replay_audit_log(log)
-    assert res.ok is False
\ No newline at end of file
+    assert res.ok is False
+
+def test_replay_reports_chain_error_over_order_error(tmp_path: Path):
+    log = tmp_path / "runtime" / "logs" / "audit.jsonl"
+    with AuditWriter(log) as w:
+        w.append("r1", "ObservationCaptured", {"obs": 1})
+        w.append("r1", "RunStarted", {"x": "y"})
+        w.append("r1", "RunCompleted", {"ok": True})
+
+    lines = log.read_text(encoding="utf-8").splitlines()
+    lines[2] = lines[2].replace("true", "false")
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    res = replay_audit_log(log)
+    assert res.ok is False
+    assert (res.error or "").startswith("audit verification failed")
+
+
+def test_replay_state_step_matches_stable_sha256():
+    from packages.core.audit.replay import _next_state_hash
+    from packages.core.codec import stable_sha256
+
+    expected = stable_sha256({"prev": "GENESIS", "event_hash": "ab" * 32, "type": "RunStarted"})
+    assert _next_state_hash("GENESIS", "ab" * 32, "RunStarted") == expected
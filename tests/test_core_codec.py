@@ -4,7 +4,9 @@ Required to ensure consistent hashing of data structures regardless
 of order. Used across the repo for GSAMA caching and deduplication.
 """
 
-from packages.core.codec import stable_sha256
+import json
+
+from packages.core.codec import canonical_json_bytes, canonicalize, stable_sha256
 from packages.core.types import TaskRequest, AgentType, ModelRequest
 
 def test_hash_stable_for_equivalent_dict_order():
@@ -21,3 +23,11 @@ def test_model_request_serializable_hashable():
     r = ModelRequest(run_id="r1", agent_type=AgentType.planner, input={"x": [3,2,1]})
     h = stable_sha256(r)
     assert isinstance(h, str) and len(h) == 64
+
+def test_canonical_bytes_match_legacy_canonicalize():
+    obj = {
+        "z": [TaskRequest(run_id="r1", task_id="t1", user_intent="é", metadata={"b": (1, 2), "a": None})],
+        "a": {"y": 1.5, "x": True},
+    }
+    legacy = json.dumps(canonicalize(obj), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    assert canonical_json_bytes(obj) == legacy
@@ -5,7 +5,6 @@ Git apply_patch tool tests.
 from __future__ import annotations
 
 from pathlib import Path
-import os
 import subprocess
 
 from packages.core.audit import AuditWriter
@@ -14,18 +13,27 @@ from packages.tools.registry import ToolRegistry
 from packages.tools.builtins import git_apply_patch_spec
 
 
+PATCH_OLD_TO_NEW = """\
+diff --git a/a.txt b/a.txt
+--- a/a.txt
++++ b/a.txt
+@@ -1 +1 @@
+-old
++new
+"""
+
+
 def _git(cmd, cwd: Path) -> None:
-    p = subprocess.run(["git"] + cmd, cwd=str(cwd), capture_output=True, text=True)
-    assert p.returncode == 0, (p.stderr or p.stdout)
+    # Output is only read on failure, so skip the text decode on the happy path.
+    p = subprocess.run(["git"] + cmd, cwd=str(cwd), capture_output=True)
+    assert p.returncode == 0, (p.stderr or p.stdout).decode("utf-8", "replace")
 
 
 def test_apply_patch_blocked_without_arm(tmp_path: Path, monkeypatch):
+    # Rejected before git runs, so the repo needs no git history.
     repo = tmp_path / "repo"
     repo.mkdir()
-    _git(["init"], repo)
     (repo / "a.txt").write_text("old\n", encoding="utf-8")
-    _git(["add", "a.txt"], repo)
-    _git(["-c", "user.email=x@y.z", "-c", "user.name=x", "commit", "-m", "init"], repo)
 
     runtime = tmp_path / "runtime"
     (runtime / "artifacts" / "diffs").mkdir(parents=True)
@@ -34,22 +42,21 @@ def test_apply_patch_blocked_without_arm(tmp_path: Path, monkeypatch):
     monkeypatch.setenv("EXECUTION_ARM", "false")
     monkeypatch.setenv("PIEBOT_APPROVAL_TOKEN", "t")
 
-    audit = AuditWriter(runtime / "logs" / "audit.jsonl")
-    reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
-    reg.register(git_apply_patch_spec)
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(git_apply_patch_spec)
+
+        res = reg.invoke(run_id="r1", tool_name="git.apply_patch", args={"diff_file": "p.diff", "approval_token": "t"})
 
-    res = reg.invoke(run_id="r1", tool_name="git.apply_patch", args={"diff_file": "p.diff", "approval_token": "t"})
     assert res.ok is False
     assert "blocked by policy" in (res.error or "")
 
 
 def test_apply_patch_blocked_without_approval(tmp_path: Path, monkeypatch):
+    # Rejected before git runs, so the repo needs no git history.
     repo = tmp_path / "repo"
     repo.mkdir()
-    _git(["init"], repo)
     (repo / "a.txt").write_text("old\n", encoding="utf-8")
-    _git(["add", "a.txt"], repo)
-    _git(["-c", "user.email=x@y.z", "-c", "user.name=x", "commit", "-m", "init"], repo)
 
     runtime = tmp_path / "runtime"
     diffs = runtime / "artifacts" / "diffs"
@@ -59,11 +66,12 @@ def test_apply_patch_blocked_without_approval(tmp_path: Path, monkeypatch):
     monkeypatch.setenv("EXECUTION_ARM", "true")
     monkeypatch.setenv("PIEBOT_APPROVAL_TOKEN", "expected")
 
-    audit = AuditWriter(runtime / "logs" / "audit.jsonl")
-    reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
-    reg.register(git_apply_patch_spec)
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(git_apply_patch_spec)
+
+        res = reg.invoke(run_id="r1", tool_name="git.apply_patch", args={"diff_file": "p.diff", "approval_token": "wrong"})
 
-    res = reg.invoke(run_id="r1", tool_name="git.apply_patch", args={"diff_file": "p.diff", "approval_token": "wrong"})
     assert res.ok is False
     assert (res.error or "") == "approval required"
 
@@ -76,14 +84,8 @@ def test_apply_patch_succeeds_with_arm_and_approval(tmp_path: Path, monkeypatch)
     _git(["add", "a.txt"], repo)
     _git(["-c", "user.email=x@y.z", "-c", "user.name=x", "commit", "-m", "init"], repo)
 
-    # Create a diff that changes a.txt
-    (repo / "a.txt").write_text("new\n", encoding="utf-8")
-    diff = subprocess.run(["git", "diff", "--no-color"], cwd=str(repo), capture_output=True, text=True)
-    assert diff.returncode == 0
-    patch_text = diff.stdout
-    assert "new" in patch_text
-    # Reset working tree
-    _git(["checkout", "--", "a.txt"], repo)
+    # A diff that changes a.txt (written directly; no git diff/checkout round trip)
+    patch_text = PATCH_OLD_TO_NEW
 
     runtime = tmp_path / "runtime"
     diffs = runtime / "artifacts" / "diffs"
@@ -93,11 +95,12 @@ def test_apply_patch_succeeds_with_arm_and_approval(tmp_path: Path, monkeypatch)
     monkeypatch.setenv("EXECUTION_ARM", "true")
     monkeypatch.setenv("PIEBOT_APPROVAL_TOKEN", "ok")
 
-    audit = AuditWriter(runtime / "logs" / "audit.jsonl")
-    reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
-    reg.register(git_apply_patch_spec)
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(git_apply_patch_spec)
+
+        res = reg.invoke(run_id="r1", tool_name="git.apply_patch", args={"diff_file": "p.diff", "approval_token": "ok"})
 
-    res = reg.invoke(run_id="r1", tool_name="git.apply_patch", args={"diff_file": "p.diff", "approval_token": "ok"})
     assert res.ok is True
     assert res.result.get("applied") is True
 
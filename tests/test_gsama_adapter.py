@@ -23,4 +23,16 @@ def test_apply_delta_persists(tmp_path: Path):
     d = StateDelta(run_id="r1", patches=[{"op": "set", "path": "gsama.counter", "value": 123}], reason="test")
     a.apply_delta(d)
     a2 = load_or_init(p)
-    assert a2.snapshot()["gsama"]["counter"] == 123
\ No newline at end of file
+    assert a2.snapshot()["gsama"]["counter"] == 123
+
+def test_apply_delta_skips_unchanged_write(tmp_path: Path):
+    p = tmp_path / "runtime" / "state" / "gsama_state.json"
+    a = load_or_init(p)
+    d = StateDelta(run_id="r1", patches=[{"op": "set", "path": "gsama.counter", "value": 1}], reason="test")
+    a.apply_delta(d)
+    p.write_bytes(p.read_bytes())  # same content, new mtime would show a rewrite
+    marker = p.stat().st_mtime_ns
+    a.apply_delta(d)
+    assert p.stat().st_mtime_ns == marker
+    assert not (p.parent / (p.name + ".tmp")).exists()
+    assert load_or_init(p).snapshot()["gsama"]["counter"] == 1
@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from packages.models import ModelRouter
 
 
@@ -27,3 +29,25 @@ routing:
     r = ModelRouter.load(cfg)
     b = r.get_backend_for_role("planner")
     assert hasattr(b, "plan")
+
+
+def test_router_load_cached_until_file_changes(tmp_path: Path):
+    cfg = tmp_path / "router.yaml"
+    cfg.write_text("models:\n  null:\n    kind: null\nrouting:\n  planner: null\n", encoding="utf-8")
+
+    r1 = ModelRouter.load(cfg)
+    assert ModelRouter.load(cfg) is r1
+    assert r1.get_backend_for_role("planner") is r1.get_backend_for_role("planner")
+
+    cfg.write_text("models:\n  null:\n    kind: null\nrouting:\n  planner: null\n  critic: null\n", encoding="utf-8")
+    r2 = ModelRouter.load(cfg)
+    assert r2 is not r1
+    assert "critic" in r2.routing.mapping
+
+
+def test_router_load_fails_fast_on_unsupported_kind(tmp_path: Path):
+    cfg = tmp_path / "router.yaml"
+    cfg.write_text("models:\n  m:\n    kind: remote\nrouting:\n  planner: m\n", encoding="utf-8")
+
+    with pytest.raises(NotImplementedError):
+        ModelRouter.load(cfg)
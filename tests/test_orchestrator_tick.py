@@ -20,7 +20,7 @@ from packages.tools.registry import ToolRegistry
 from packages.tools.builtins import fs_read_file_spec
 
 
-def test_orchestrator_tick_audited_and_replayable(tmp_path: Path):
+def test_orchestrator_tick_audited_and_replayable(tmp_path: Path, null_router: ModelRouter):
     # Fake repo root
     repo = tmp_path / "repo"
     repo.mkdir()
@@ -29,32 +29,17 @@ def test_orchestrator_tick_audited_and_replayable(tmp_path: Path):
     # Runtime root
     runtime = tmp_path / "runtime"
 
-    audit = get_audit_writer(runtime)
-    policy = PolicyEngine()
-    tools = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
-    tools.register(fs_read_file_spec)
+    with get_audit_writer(runtime) as audit:
+        policy = PolicyEngine()
+        tools = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
+        tools.register(fs_read_file_spec)
 
-    cfg = tmp_path / "router.yaml"
-    cfg.write_text(
-        """
-models:
-  null:
-    kind: null
-    capabilities: []
-routing:
-  planner: null
-  executor: null
-  critic: null
-""".strip(),
-        encoding="utf-8",
-    )
-    router = ModelRouter.load(cfg)
-    orch = Orchestrator(tools=tools, audit=audit, router=router, runtime_root=runtime)
+        orch = Orchestrator(tools=tools, audit=audit, router=null_router, runtime_root=runtime)
 
 
-    run_id = uuid.uuid4().hex
-    obs = ObservationEvent(run_id=run_id, kind="file_read", data={"path": "hello.txt"})
-    res = orch.run_once(obs)
+        run_id = uuid.uuid4().hex
+        obs = ObservationEvent(run_id=run_id, kind="file_read", data={"path": "hello.txt"})
+        res = orch.run_once(obs)
 
     assert res.ok is True
     assert len(res.tool_results) == 1
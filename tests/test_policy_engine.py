@@ -30,4 +30,22 @@ def test_write_allowed_with_arm_but_requires_approval(monkeypatch):
     pe = PolicyEngine()
     d = pe.decide("git.apply_patch", RiskClass.WRITE, {})
     assert d.allow is True
-    assert d.requires_approval is True
\ No newline at end of file
+    assert d.requires_approval is True
+
+def test_flags_cached_until_refresh(monkeypatch):
+    monkeypatch.setenv("EXECUTION_ARM", "false")
+    pe = PolicyEngine()
+    monkeypatch.setenv("EXECUTION_ARM", "true")
+    assert pe.decide("git.apply_patch", RiskClass.WRITE, {}).allow is False
+    pe.refresh()
+    assert pe.decide("git.apply_patch", RiskClass.WRITE, {}).allow is True
+
+def test_redact_text_prefilter_keeps_pattern_semantics():
+    from packages.policy.engine import redact_text
+    clean = "read README.md and list src/"
+    assert redact_text(clean) is clean
+    assert redact_text("API_KEY = \"abc\" ok") == "[REDACTED] ok"
+    # Characters re.IGNORECASE folds onto ASCII letters must not slip past the prefilter.
+    assert redact_text("api_\u212aey: 'abc'") == "[REDACTED]"
+    assert redact_text("author\u0131zation: 'abc'") == "[REDACTED]"
+    assert redact_text("\u017fk-" + "a" * 20) == "[REDACTED]"
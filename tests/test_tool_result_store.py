@@ -20,11 +20,12 @@ def test_tool_result_written_as_artifact(tmp_path: Path):
     (repo / "hello.txt").write_text("hi", encoding="utf-8")
 
     runtime = tmp_path / "runtime"
-    audit = AuditWriter(runtime / "logs" / "audit.jsonl")
-    reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
-    reg.register(fs_read_file_spec)
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(fs_read_file_spec)
+
+        res = reg.invoke(run_id="r1", tool_name="fs.read_file", args={"path": "hello.txt"})
 
-    res = reg.invoke(run_id="r1", tool_name="fs.read_file", args={"path": "hello.txt"})
     assert res.ok is True
 
     # Artifact exists
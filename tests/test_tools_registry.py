@@ -20,12 +20,13 @@ def test_registry_invokes_read_tool_and_audits(tmp_path: Path):
     runtime = tmp_path / "runtime"
     log = runtime / "logs" / "audit.jsonl"
 
-    audit = AuditWriter(log)
-    policy = PolicyEngine()
-    reg = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
-    reg.register(fs_read_file_spec)
+    with AuditWriter(log) as audit:
+        policy = PolicyEngine()
+        reg = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(fs_read_file_spec)
+
+        res = reg.invoke(run_id="r1", tool_name="fs.read_file", args={"path": "hello.txt"})
 
-    res = reg.invoke(run_id="r1", tool_name="fs.read_file", args={"path": "hello.txt"})
     assert res.ok is True
     assert res.result["text"] == "hi"
 
@@ -39,15 +40,16 @@ def test_registry_blocks_exec_by_default(tmp_path: Path):
     runtime = tmp_path / "runtime"
     log = runtime / "logs" / "audit.jsonl"
 
-    audit = AuditWriter(log)
-    policy = PolicyEngine()  # ALLOW_EXEC defaults false
-    reg = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
+    with AuditWriter(log) as audit:
+        policy = PolicyEngine()  # ALLOW_EXEC defaults false
+        reg = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
+
+        def _noop(args, ctx):
+            return {"ok": True}
 
-    def _noop(args, ctx):
-        return {"ok": True}
+        reg.register(ToolSpec(name="danger.exec", risk=RiskClass.EXEC, schema={"type": "object"}, handler=_noop))
+        res = reg.invoke(run_id="r1", tool_name="danger.exec", args={})
 
-    reg.register(ToolSpec(name="danger.exec", risk=RiskClass.EXEC, schema={"type": "object"}, handler=_noop))
-    res = reg.invoke(run_id="r1", tool_name="danger.exec", args={})
     assert res.ok is False
     assert "blocked by policy" in (res.error or "")
 
@@ -58,11 +60,59 @@ def test_builtin_specs_registerable(tmp_path: Path):
     runtime = tmp_path / "runtime"
     log = runtime / "logs" / "audit.jsonl"
 
-    audit = AuditWriter(log)
-    policy = PolicyEngine()
-    reg = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
-    reg.register(fs_list_dir_spec)
-    reg.register(fs_read_file_spec)
-    reg.register(git_diff_spec)
-    assert reg.get_spec("fs.list_dir") is not None
-    assert reg.get_spec("git.diff") is not None
+    with AuditWriter(log) as audit:
+        policy = PolicyEngine()
+        reg = ToolRegistry(policy=policy, audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(fs_list_dir_spec)
+        reg.register(fs_read_file_spec)
+        reg.register(git_diff_spec)
+        assert reg.get_spec("fs.list_dir") is not None
+        assert reg.get_spec("git.diff") is not None
+
+
+def test_registry_expected_error_has_no_traceback(tmp_path: Path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    runtime = tmp_path / "runtime"
+
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(fs_read_file_spec)
+        res = reg.invoke(run_id="r1", tool_name="fs.read_file", args={"path": "missing.txt"})
+
+    assert res.ok is False
+    assert res.error == "FileNotFoundError: missing.txt"
+    assert res.result == {}
+
+
+def test_registry_list_dir_sorted_with_kinds(tmp_path: Path):
+    repo = tmp_path / "repo"
+    (repo / "b_dir").mkdir(parents=True)
+    (repo / "a.txt").write_text("a", encoding="utf-8")
+    runtime = tmp_path / "runtime"
+
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(fs_list_dir_spec)
+        res = reg.invoke(run_id="r1", tool_name="fs.list_dir", args={"path": "."})
+
+    assert res.ok is True
+    assert res.result["items"] == [
+        {"name": "a.txt", "is_dir": False, "is_file": True},
+        {"name": "b_dir", "is_dir": True, "is_file": False},
+    ]
+
+
+def test_registry_rejects_path_escaping_repo(tmp_path: Path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (tmp_path / "outside.txt").write_text("secret", encoding="utf-8")
+    runtime = tmp_path / "runtime"
+
+    with AuditWriter(runtime / "logs" / "audit.jsonl") as audit:
+        reg = ToolRegistry(policy=PolicyEngine(), audit=audit, repo_root=repo, runtime_root=runtime)
+        reg.register(fs_read_file_spec)
+        res = reg.invoke(run_id="r1", tool_name="fs.read_file", args={"path": "../outside.txt"})
+
+    assert res.ok is False
+    assert res.error == "ValueError: path escapes repo root"
@@ -34,4 +34,38 @@ def test_clear_run():
     assert wm.set("r2.k1", "v2", ttl_seconds=10, run_id="r2") is True
     wm.clear_run("r1")
     assert wm.get("r1.k1") is None
-    assert wm.get("r2.k1") == "v2"
\ No newline at end of file
+    assert wm.get("r2.k1") == "v2"
+
+def test_overwrite_extends_ttl():
+    wm = WorkingMemory(max_entries=10, max_bytes=10_000)
+    assert wm.set("k", "v1", ttl_seconds=0.01) is True
+    assert wm.set("k", "v2", ttl_seconds=10) is True
+    time.sleep(0.02)
+    assert wm.get("k") == "v2"
+    assert wm.stats()["entries"] == 1
+
+
+def test_clear_run_after_overwrite_to_other_run():
+    wm = WorkingMemory(max_entries=10, max_bytes=10_000)
+    assert wm.set("k", "v1", ttl_seconds=10, run_id="r1") is True
+    assert wm.set("k", "v2", ttl_seconds=10, run_id="r2") is True
+    wm.clear_run("r1")
+    assert wm.get("k") == "v2"
+    wm.clear_run("r2")
+    assert wm.get("k") is None
+    assert wm.stats()["entries"] == 0
+
+
+def test_hard_cap_bytes_nested_value_fail_closed():
+    wm = WorkingMemory(max_entries=10, max_bytes=10_000)
+    assert wm.set("a", {"x": {"t": "z" * 50_000}}, ttl_seconds=10) is False
+    assert wm.set("b", [[["é" * 6_000]]], ttl_seconds=10) is False  # 12k UTF-8 bytes
+    assert wm.stats()["bytes_used"] == 0
+
+
+def test_non_finite_ttl():
+    wm = WorkingMemory(max_entries=10, max_bytes=10_000)
+    assert wm.set("forever", "v", ttl_seconds=float("inf")) is True
+    assert wm.get("forever") == "v"
+    assert wm.set("nan", "v", ttl_seconds=float("nan")) is False
+    assert wm.get("nan") is None